@@ -2,20 +2,122 @@
 
 from __future__ import annotations
 
+import functools
+import math
 from dataclasses import dataclass
-from typing import Any, overload
+from typing import TYPE_CHECKING, Any, overload
 
 import numpy as np
-from numpy import vectorize
 from scipy.interpolate import InterpolatedUnivariateSpline
 
 from cosmology.compat.classy import constants
 from cosmology.compat.classy._core import Array, CosmologyWrapper, InputT
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from numpy.typing import DTypeLike
+    from typing_extensions import TypeAlias
+
 __all__: list[str] = []
 
 
-_MPCS_KM_TO_GYR = np.array("978.5", dtype=np.float64)  # [Mpc s / km -> Gyr]
+_MPCS_KM_TO_GYR = 978.5  # [Mpc s / km -> Gyr]
+_CRITICAL_DENSITY_FACTOR = float(3e6 / (8 * np.pi * constants.G))  # [H^2 -> Msol Mpc-3]
+
+# Redshift arrays smaller than this are memoized by value in ``_cosmo_fn``.
+_MEMOIZE_MAX_SIZE = 100_000
+
+# (Omega_k, sqrt(|Omega_k|), 1 / sqrt(|Omega_k|), 2 pi d_H^3 / Omega_k, f)
+_CurvedVolumeParams: TypeAlias = tuple[float, float, float, float, np.ufunc]
+
+# Methods supported by ``evaluate_background``.
+_BACKGROUND_METHODS = (
+    "Omega_m",
+    "H",
+    "angular_diameter_distance",
+    "luminosity_distance",
+)
+
+
+def _readonly_array(value: float, /) -> Array:
+    """Return ``value`` as a read-only 0-d float64 array that can be shared."""
+    arr = np.array(value, dtype=np.float64)
+    arr.flags.writeable = False
+    return arr
+
+
+def _vectorize(func: Callable[[float], float], /) -> Callable[[InputT], Array]:
+    """Vectorize a scalar :mod:`classy` function over redshift.
+
+    :func:`numpy.frompyfunc` has much less per-element overhead than
+    :class:`numpy.vectorize`, but returns object arrays, so the result is cast
+    back to ``float64``.
+    """
+    ufunc = np.frompyfunc(func, 1, 1)
+
+    def vectorized(z: InputT, /) -> Array:
+        return np.asarray(ufunc(z), dtype=np.float64)
+
+    return vectorized
+
+
+def _memoize(
+    func: Callable[[InputT], Array], /, maxsize: int = 8
+) -> Callable[[InputT], Array]:
+    """Memoize a vectorized function on the value of its redshift array.
+
+    Likelihoods often evaluate the same fixed redshift grid many times. Numeric
+    arrays with fewer than ``_MEMOIZE_MAX_SIZE`` elements are looked up by their
+    bytes, dtype and shape in an LRU cache of ``maxsize`` entries. The cached
+    result is copied on return, so callers may still modify it in place.
+    """
+
+    @functools.lru_cache(maxsize=maxsize)
+    def cached(buffer: bytes, dtype: str, shape: tuple[int, ...]) -> Array:
+        return func(np.frombuffer(buffer, dtype=dtype).reshape(shape))
+
+    def memoized(z: InputT, /) -> Array:
+        z = np.asarray(z)
+        if z.dtype.kind not in "biuf" or z.size >= _MEMOIZE_MAX_SIZE:
+            return func(z)
+        return cached(z.tobytes(), z.dtype.str, z.shape).copy()
+
+    return memoized
+
+
+def _comoving_volume_curved(x: Array, params: _CurvedVolumeParams, /) -> Array:
+    r"""Comoving volume in cubic Mpc of a curved universe.
+
+    .. math::
+
+        V_c = \frac{2 \pi d_H^3}{\Omega_k} \left( x \sqrt{1 + \Omega_k x^2}
+              - \frac{f(\sqrt{|\Omega_k|} x)}{\sqrt{|\Omega_k|}} \right)
+
+    with :math:`f = \sinh^{-1}` for :math:`\Omega_k > 0` and
+    :math:`f = \sin^{-1}` for :math:`\Omega_k < 0`. The whole expression is
+    evaluated with in-place ufuncs on ``x``, the dimensionless transverse
+    comoving distance, and one output buffer; ``x`` is overwritten.
+
+    ``params`` is the precomputed tuple ``(Omega_k, sqrt(|Omega_k|),
+    1 / sqrt(|Omega_k|), 2 pi d_H^3 / Omega_k, f)``.
+    """
+    ok0, sqrt_abs_ok0, inv_sqrt_abs_ok0, prefactor, arcfn = params
+
+    cv = np.empty_like(x)
+    np.square(x, out=cv)
+    cv *= ok0
+    cv += 1.0
+    np.sqrt(cv, out=cv)
+    cv *= x
+
+    x *= sqrt_abs_ok0
+    arcfn(x, out=x)
+    x *= inv_sqrt_abs_ok0
+
+    cv -= x
+    cv *= prefactor
+    return cv
 
 
 @dataclass(frozen=True)
@@ -38,10 +140,12 @@ class StandardCosmologyWrapper(CosmologyWrapper):
             self,
             "_cosmo_fn",
             {
-                "Om_m": vectorize(self.cosmo.Om_m),
-                "Hubble": vectorize(self.cosmo.Hubble),
-                "angular_distance": vectorize(self.cosmo.angular_distance),
-                "luminosity_distance": vectorize(self.cosmo.luminosity_distance),
+                "Om_m": _memoize(_vectorize(self.cosmo.Om_m)),
+                "Hubble": _memoize(_vectorize(self.cosmo.Hubble)),
+                "angular_distance": _memoize(_vectorize(self.cosmo.angular_distance)),
+                "luminosity_distance": _memoize(
+                    _vectorize(self.cosmo.luminosity_distance)
+                ),
                 "comoving_distance": InterpolatedUnivariateSpline(
                     bkg["z"][::-1],
                     bkg["comov. dist."][::-1],
@@ -52,6 +156,83 @@ class StandardCosmologyWrapper(CosmologyWrapper):
             },
         )
 
+        # Background scalars are fixed for a computed CLASS cosmology, so they
+        # are cached here instead of calling into CLASS on every access.
+        self._Hubble0: float
+        object.__setattr__(self, "_Hubble0", self.cosmo.Hubble(0))
+        self._Omega0_k: float
+        object.__setattr__(self, "_Omega0_k", self.cosmo.Omega0_k())
+        self._T_cmb: float
+        object.__setattr__(self, "_T_cmb", self.cosmo.T_cmb())
+        if self._Omega0_k != 0:
+            sqrt_abs_ok0 = math.sqrt(abs(self._Omega0_k))
+            self._curved_volume_params: _CurvedVolumeParams
+            object.__setattr__(
+                self,
+                "_curved_volume_params",
+                (
+                    self._Omega0_k,
+                    sqrt_abs_ok0,
+                    1 / sqrt_abs_ok0,
+                    2 * math.pi / (self._Hubble0**3 * self._Omega0_k),
+                    np.arcsinh if self._Omega0_k > 0 else np.arcsin,
+                ),
+            )
+
+        # Scalar properties return shared read-only 0-d arrays, built once here
+        # rather than on every access.
+        h0 = float(constants.c * self._Hubble0)
+        omega_lambda = self.cosmo.Omega_Lambda()
+        omega_m = self.cosmo.Omega_m()
+        scalars = {
+            "Omega_tot0": (
+                omega_lambda + omega_m + self._Omega0_k + self.cosmo.Omega_r()
+            ),
+            "Omega_k0": self._Omega0_k,
+            "Omega_m0": omega_m,
+            "Omega_b0": self.cosmo.Omega_b(),
+            "Neff": self.cosmo.Neff(),
+            "Omega_de0": omega_lambda,
+            "Omega_dm0": self.cosmo.Omega0_cdm(),
+            "Omega_gamma0": self.cosmo.Omega_g(),
+            "critical_density0": _CRITICAL_DENSITY_FACTOR * h0**2,
+            "H0": h0,
+            "hubble_distance": 1 / self._Hubble0,
+            "hubble_time": _MPCS_KM_TO_GYR / h0,
+            "scale_factor0": 1.0,
+            "T_cmb0": self._T_cmb,
+        }
+        self._scalars: dict[str, Array]
+        object.__setattr__(
+            self, "_scalars", {k: _readonly_array(v) for k, v in scalars.items()}
+        )
+
+        # The curvature of the cosmology is fixed, so the comoving volume
+        # branch is selected once here rather than on every call.
+        self._comoving_volume_impl: Callable[[InputT], Array]
+        object.__setattr__(
+            self,
+            "_comoving_volume_impl",
+            (
+                self._comoving_volume_flat
+                if self._Omega0_k == 0
+                else self._comoving_volume_nonflat
+            ),
+        )
+
+    def _eval(self, name: str, z: InputT, /, dtype: DTypeLike | None = None) -> Array:
+        """Evaluate the :mod:`classy` function ``name`` at redshift ``z``.
+
+        Scalar redshifts are passed directly to CLASS, bypassing the vectorized
+        function in ``_cosmo_fn``. The result is float64 unless another
+        ``dtype`` is requested.
+        """
+        if np.isscalar(z):
+            out = np.asarray(getattr(self.cosmo, name)(z), dtype=np.float64)
+        else:
+            out = self._cosmo_fn[name](z)
+        return out if dtype is None else out.astype(dtype, copy=False)
+
     # ----------------------------------------------
     # HasTotalComponent
 
@@ -66,12 +247,7 @@ class StandardCosmologyWrapper(CosmologyWrapper):
             \Omega_{\rm tot} = \Omega_{\rm m} + \Omega_{\rm r} + \Omega_{\rm de}
             + \Omega_{\rm k}
         """
-        return np.array(
-            self.cosmo.Omega_Lambda()
-            + self.cosmo.Omega_m()
-            + self.cosmo.Omega0_k()
-            + self.cosmo.Omega_r()
-        )
+        return self._scalars["Omega_tot0"]
 
     def Omega_tot(self, z: InputT, /) -> Array:
         r"""Redshift-dependent total density parameter.
@@ -93,7 +269,7 @@ class StandardCosmologyWrapper(CosmologyWrapper):
     @property
     def Omega_k0(self) -> Array:
         """Omega curvature; the effective curvature density/critical density at z=0."""
-        return np.asarray(self.cosmo.Omega0_k())
+        return self._scalars["Omega_k0"]
 
     def Omega_k(self, z: InputT, /) -> Array:
         """Redshift-dependent curvature density parameter."""
@@ -105,17 +281,25 @@ class StandardCosmologyWrapper(CosmologyWrapper):
     @property
     def Omega_m0(self) -> Array:
         """Matter density at z=0."""
-        return np.asarray(self.cosmo.Omega_m())
+        return self._scalars["Omega_m0"]
 
-    def Omega_m(self, z: InputT, /) -> Array:
+    def Omega_m(self, z: InputT, /, *, dtype: DTypeLike | None = None) -> Array:
         """Redshift-dependent non-relativistic matter density parameter.
 
+        Parameters
+        ----------
+        z : Array, positional-only
+            Input redshift.
+        dtype : data-type or None, optional, keyword-only
+            The dtype of the output. CLASS always computes in double precision,
+            but e.g. ``numpy.float32`` halves the memory of the returned array.
+
         Notes
         -----
         This does not include neutrinos, even if non-relativistic at the
         redshift of interest; see `Onu`.
         """
-        return np.asarray(self._cosmo_fn["Om_m"](z))
+        return self._eval("Om_m", z, dtype)
 
     # ----------------------------------------------
     # HasBaryonComponent
@@ -123,7 +307,7 @@ class StandardCosmologyWrapper(CosmologyWrapper):
     @property
     def Omega_b0(self) -> Array:
         """Baryon density at z=0."""
-        return np.asarray(self.cosmo.Omega_b())
+        return self._scalars["Omega_b0"]
 
     def Omega_b(self, z: InputT, /) -> Array:
         """Redshift-dependent baryon density parameter.
@@ -146,7 +330,7 @@ class StandardCosmologyWrapper(CosmologyWrapper):
     @property
     def Neff(self) -> Array:
         """Effective number of neutrino species."""
-        return np.asarray(self.cosmo.Neff())
+        return self._scalars["Neff"]
 
     @property
     def m_nu(self) -> tuple[Array, ...]:
@@ -163,7 +347,7 @@ class StandardCosmologyWrapper(CosmologyWrapper):
     @property
     def Omega_de0(self) -> Array:
         """Dark energy density at z=0."""
-        return np.asarray(self.cosmo.Omega_Lambda())
+        return self._scalars["Omega_de0"]
 
     def Omega_de(self, z: InputT, /) -> Array:
         """Redshift-dependent dark energy density parameter."""
@@ -175,7 +359,7 @@ class StandardCosmologyWrapper(CosmologyWrapper):
     @property
     def Omega_dm0(self) -> Array:
         """Omega dark matter; dark matter density/critical density at z=0."""
-        return np.asarray(self.cosmo.Omega0_cdm())
+        return self._scalars["Omega_dm0"]
 
     def Omega_dm(self, z: InputT, /) -> Array:
         """Redshift-dependent dark matter density parameter.
@@ -193,7 +377,7 @@ class StandardCosmologyWrapper(CosmologyWrapper):
     @property
     def Omega_gamma0(self) -> Array:
         """Omega gamma; the density/critical density of photons at z=0."""
-        return np.asarray(self.cosmo.Omega_g())
+        return self._scalars["Omega_gamma0"]
 
     def Omega_gamma(self, z: InputT, /) -> Array:
         """Redshift-dependent photon density parameter."""
@@ -205,11 +389,14 @@ class StandardCosmologyWrapper(CosmologyWrapper):
     @property
     def critical_density0(self) -> Array:
         """Critical density at z = 0 in Msol Mpc-3."""
-        return np.array(3e6 * self.H0**2 / (8 * np.pi * constants.G))
+        return self._scalars["critical_density0"]
 
     def critical_density(self, z: InputT, /) -> Array:
         """Redshift-dependent critical density in Msol Mpc-3."""
-        return np.array(3e6 * self.H(z) ** 2 / (8 * np.pi * constants.G))
+        rho = self.H(z)
+        np.square(rho, out=rho)
+        rho *= _CRITICAL_DENSITY_FACTOR
+        return rho
 
     # ----------------------------------------------
     # HubbleParameter
@@ -217,25 +404,36 @@ class StandardCosmologyWrapper(CosmologyWrapper):
     @property
     def H0(self) -> Array:
         """Hubble constant at z=0 in km s-1 Mpc-1."""
-        return np.array(constants.c * self.cosmo.Hubble(0))
+        return self._scalars["H0"]
 
     @property
     def hubble_distance(self) -> Array:
         """Hubble distance in Mpc."""
-        return np.array(1 / self.cosmo.Hubble(0))
+        return self._scalars["hubble_distance"]
 
     @property
     def hubble_time(self) -> Array:
         """Hubble time in Gyr."""
-        return np.array(_MPCS_KM_TO_GYR / self.H0)
+        return self._scalars["hubble_time"]
+
+    def H(self, z: InputT, /, *, dtype: DTypeLike | None = None) -> Array:
+        """Hubble function :math:`H(z)` in km s-1 Mpc-1.
 
-    def H(self, z: InputT, /) -> Array:
-        """Hubble function :math:`H(z)` in km s-1 Mpc-1."""  # noqa: D402
-        return np.array(constants.c * self._cosmo_fn["Hubble"](z))
+        Parameters
+        ----------
+        z : Array, positional-only
+            Input redshift.
+        dtype : data-type or None, optional, keyword-only
+            The dtype of the output. CLASS always computes in double precision,
+            but e.g. ``numpy.float32`` halves the memory of the returned array.
+        """  # noqa: D402
+        hubble = self._eval("Hubble", z)
+        np.multiply(constants.c, hubble, out=hubble)
+        return hubble if dtype is None else hubble.astype(dtype, copy=False)
 
     def H_over_H0(self, z: InputT, /) -> Array:
         """Standardised Hubble function :math:`E(z) = H(z)/H_0`."""
-        return self._cosmo_fn["Hubble"](z) / self.cosmo.Hubble(0)
+        return self._eval("Hubble", z) / self._Hubble0
 
     # ----------------------------------------------
     # Scale factor
@@ -243,11 +441,17 @@ class StandardCosmologyWrapper(CosmologyWrapper):
     @property
     def scale_factor0(self) -> Array:
         """Scale factor at z=0."""
-        return np.asarray(1.0)
+        return self._scalars["scale_factor0"]
 
     def scale_factor(self, z: InputT, /) -> Array:
         """Redshift-dependenct scale factor :math:`a = a_0 / (1 + z)`."""
-        return np.asarray(self.scale_factor0 / (z + 1))
+        # a_0 = 1, so this is just 1 / (1 + z).
+        if np.isscalar(z):
+            return np.asarray(np.reciprocal(np.add(z, 1.0)))
+        a = np.array(z, dtype=np.result_type(z, 1.0))
+        a += 1.0
+        np.reciprocal(a, out=a)
+        return a
 
     # ----------------------------------------------
     # Temperature
@@ -255,11 +459,11 @@ class StandardCosmologyWrapper(CosmologyWrapper):
     @property
     def T_cmb0(self) -> Array:
         """Temperature of the CMB at z=0."""
-        return np.asarray(self.cosmo.T_cmb())
+        return self._scalars["T_cmb0"]
 
     def T_cmb(self, z: InputT, /) -> Array:
         """Temperature of the CMB at redshift ``z``."""
-        return self.T_cmb0 * (z + 1)
+        return np.asarray(self._T_cmb * (z + 1))
 
     # ----------------------------------------------
     # Time
@@ -336,27 +540,21 @@ class StandardCosmologyWrapper(CosmologyWrapper):
         """
         raise NotImplementedError
 
-    def _comoving_volume_flat(self, z: InputT, /) -> Array:
-        return 4.0 / 3.0 * np.pi * self.comoving_distance(z) ** 3
-
-    def _comoving_volume_positive(self, z: InputT, /) -> Array:
-        dh = self.hubble_distance
-        x = self.transverse_comoving_distance(z) / dh
-        term1 = 4.0 * np.pi * dh**3 / (2.0 * self.Omega_k0)
-        term2 = x * np.sqrt(1 + self.Omega_k0 * (x) ** 2)
-        term3 = np.sqrt(np.abs(self.Omega_k0)) * x
+    def _x_M(self, z: InputT, /) -> Array:
+        """Dimensionless transverse comoving distance :math:`x_M = d_M / d_H`.
 
-        return term1 * (
-            term2 - 1.0 / np.sqrt(np.abs(self.Omega_k0)) * np.arcsinh(term3)
+        Returns a new array that callers are free to modify in place.
+        """
+        return np.array(
+            self.transverse_comoving_distance(z) / self.hubble_distance,
+            dtype=np.float64,
         )
 
-    def _comoving_volume_negative(self, z: InputT, /) -> Array:
-        dh = self.hubble_distance
-        x = self.transverse_comoving_distance(z) / dh
-        term1 = 4.0 * np.pi * dh**3 / (2.0 * self.Omega_k0)
-        term2 = x * np.sqrt(1 + self.Omega_k0 * (x) ** 2)
-        term3 = np.sqrt(np.abs(self.Omega_k0)) * x
-        return term1 * (term2 - 1.0 / np.sqrt(np.abs(self.Omega_k0)) * np.arcsin(term3))
+    def _comoving_volume_flat(self, z: InputT, /) -> Array:
+        return 4.0 / 3.0 * np.pi * self.comoving_distance(z) ** 3
+
+    def _comoving_volume_nonflat(self, z: InputT, /) -> Array:
+        return _comoving_volume_curved(self._x_M(z), self._curved_volume_params)
 
     @overload
     def comoving_volume(self, z: InputT, /) -> Array:
@@ -376,13 +574,7 @@ class StandardCosmologyWrapper(CosmologyWrapper):
         if z2 is not None:
             raise NotImplementedError
 
-        if self.Omega_k0 == 0:
-            cv = self._comoving_volume_flat(z1)
-        elif self.Omega_k0 > 0:
-            cv = self._comoving_volume_positive(z1)
-        else:
-            cv = self._comoving_volume_negative(z1)
-        return cv
+        return self._comoving_volume_impl(z1)
 
     def differential_comoving_volume(self, z: InputT, /) -> Array:
         r"""Differential comoving volume in cubic Mpc per steradian.
@@ -398,9 +590,10 @@ class StandardCosmologyWrapper(CosmologyWrapper):
             = \frac{\mathtt{xm(z)^2}}{\mathtt{ef(z)}} \;.
 
         """
-        return (
-            self.transverse_comoving_distance(z) / self.hubble_distance
-        ) ** 2 / self.H_over_H0(z)
+        xm = self._x_M(z)
+        np.square(xm, out=xm)
+        xm /= self.H_over_H0(z)
+        return xm
 
     # ----------------------------------------------
     # Proper
@@ -529,15 +722,24 @@ class StandardCosmologyWrapper(CosmologyWrapper):
     # Angular diameter
 
     @overload
-    def angular_diameter_distance(self, z: InputT, /) -> Array:
+    def angular_diameter_distance(
+        self, z: InputT, /, *, dtype: DTypeLike | None = None
+    ) -> Array:
         ...
 
     @overload
-    def angular_diameter_distance(self, z1: InputT, z2: InputT, /) -> Array:
+    def angular_diameter_distance(
+        self, z1: InputT, z2: InputT, /, *, dtype: DTypeLike | None = None
+    ) -> Array:
         ...
 
     def angular_diameter_distance(
-        self, z1: InputT, z2: InputT | None = None, /
+        self,
+        z1: InputT,
+        z2: InputT | None = None,
+        /,
+        *,
+        dtype: DTypeLike | None = None,
     ) -> Array:
         """Angular diameter distance :math:`d_A` in Mpc.
 
@@ -552,6 +754,9 @@ class StandardCosmologyWrapper(CosmologyWrapper):
             Input redshifts. If one argument ``z`` is given, the distance
             :math:`d_A(0, z)` is returned. If two arguments ``z1, z2`` are
             given, the distance :math:`d_A(z_1, z_2)` is returned.
+        dtype : data-type or None, optional, keyword-only
+            The dtype of the output. CLASS always computes in double precision,
+            but e.g. ``numpy.float32`` halves the memory of the returned array.
 
         Returns
         -------
@@ -566,20 +771,31 @@ class StandardCosmologyWrapper(CosmologyWrapper):
         """
         if z2 is not None:
             raise NotImplementedError
-        return np.asarray(self._cosmo_fn["angular_distance"](z1))
+        return self._eval("angular_distance", z1, dtype)
 
     # ----------------------------------------------
     # Luminosity distance
 
     @overload
-    def luminosity_distance(self, z: InputT, /) -> Array:
+    def luminosity_distance(
+        self, z: InputT, /, *, dtype: DTypeLike | None = None
+    ) -> Array:
         ...
 
     @overload
-    def luminosity_distance(self, z1: InputT, z2: InputT, /) -> Array:
+    def luminosity_distance(
+        self, z1: InputT, z2: InputT, /, *, dtype: DTypeLike | None = None
+    ) -> Array:
         ...
 
-    def luminosity_distance(self, z1: InputT, z2: InputT | None = None, /) -> Array:
+    def luminosity_distance(
+        self,
+        z1: InputT,
+        z2: InputT | None = None,
+        /,
+        *,
+        dtype: DTypeLike | None = None,
+    ) -> Array:
         """Redshift-dependent luminosity distance :math:`d_L` in Mpc.
 
         This is the distance to use when converting between the bolometric flux
@@ -592,6 +808,9 @@ class StandardCosmologyWrapper(CosmologyWrapper):
             Input redshifts. If one argument ``z`` is given, the distance
             :math:`d_L(0, z)` is returned. If two arguments ``z1, z2`` are
             given, the distance :math:`d_L(z_1, z_2)` is returned.
+        dtype : data-type or None, optional, keyword-only
+            The dtype of the output. CLASS always computes in double precision,
+            but e.g. ``numpy.float32`` halves the memory of the returned array.
 
         Returns
         -------
@@ -604,4 +823,84 @@ class StandardCosmologyWrapper(CosmologyWrapper):
         """
         if z2 is not None:
             raise NotImplementedError
-        return np.asarray(self._cosmo_fn["luminosity_distance"](z1))
+        return self._eval("luminosity_distance", z1, dtype)
+
+    def distances(self, z: InputT, /) -> tuple[Array, Array]:
+        r"""Angular diameter and luminosity distances in Mpc.
+
+        Both distances are derived from a single CLASS evaluation per redshift
+        using :math:`d_L = (1 + z)^2 \, d_A`, which halves the number of CLASS
+        calls compared to `angular_diameter_distance` followed by
+        `luminosity_distance`.
+
+        The derived :math:`d_L` inherits the interpolation error of CLASS's
+        :math:`d_A` table, which at low redshift is larger than that of its
+        separate :math:`d_L` table. Below :math:`z \approx 0.01` the derived
+        :math:`d_L` is off by up to about :math:`5 \times 10^{-5}` relative,
+        roughly eight times the error of `luminosity_distance`; at higher
+        redshift the two agree to better than :math:`10^{-8}`. Use
+        `luminosity_distance` where low-redshift precision matters, e.g. for
+        the Hubble diagram of nearby sources.
+
+        Parameters
+        ----------
+        z : Array, positional-only
+            Input redshift.
+
+        Returns
+        -------
+        tuple[Array, Array]
+            The angular diameter distance :math:`d_A` and the luminosity
+            distance :math:`d_L` in Mpc.
+        """
+        da = self._eval("angular_distance", z)
+        dl = np.array(z, dtype=np.float64)
+        dl += 1.0
+        np.square(dl, out=dl)
+        dl *= da
+        return da, dl
+
+    # ----------------------------------------------
+    # Batched evaluation
+
+    def evaluate_background(
+        self, z: InputT, /, which: Iterable[str] = _BACKGROUND_METHODS
+    ) -> dict[str, Array]:
+        """Evaluate several background quantities at once.
+
+        This is a convenience for calling each method in ``which`` on ``z``;
+        every method still goes through its own memoized CLASS function.
+
+        Parameters
+        ----------
+        z : Array, positional-only
+            Input redshift.
+        which : iterable of str, optional
+            The names of the methods to evaluate, any of ``"Omega_m"``,
+            ``"H"``, ``"angular_diameter_distance"`` and
+            ``"luminosity_distance"``. By default all of them are evaluated.
+
+        Returns
+        -------
+        dict[str, Array]
+            The value of each method in ``which`` at redshift ``z``.
+
+        Raises
+        ------
+        TypeError
+            If ``which`` is a single string rather than an iterable of names.
+        ValueError
+            If ``which`` contains an unsupported method name.
+        """
+        if isinstance(which, str):
+            msg = f"which must be an iterable of method names, not {which!r}"
+            raise TypeError(msg)
+        which = tuple(which)
+        unknown = set(which).difference(_BACKGROUND_METHODS)
+        if unknown:
+            msg = (
+                f"cannot evaluate {sorted(unknown)}, "
+                f"must be one of {_BACKGROUND_METHODS}"
+            )
+            raise ValueError(msg)
+        return {name: getattr(self, name)(z) for name in which}
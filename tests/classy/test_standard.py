@@ -6,11 +6,14 @@ from types import SimpleNamespace
 
 import numpy as np
 import pytest
+from hypothesis import given
 
 from cosmology.api import StandardCosmology
 from cosmology.api import StandardCosmologyWrapper as StandardCosmologyWrapperAPI
 from cosmology.compat.classy import StandardCosmologyWrapper
+from cosmology.compat.classy._standard import _comoving_volume_curved
 
+from .conftest import z_arr_st
 from .test_components import (
     BaryonComponent_Test,
     CurvatureComponent_Test,
@@ -30,6 +33,29 @@ from .test_extras import CriticalDensity_Test, HubbleParameter_Test
 ################################################################################
 
 
+@pytest.mark.parametrize(("ok0", "arcfn"), [(0.05, np.arcsinh), (-0.05, np.arcsin)])
+def test_comoving_volume_curved(ok0, arcfn):
+    """Test the curved comoving-volume kernel against the closed form."""
+    dh = 4400.0
+    x = np.linspace(0.0, 3.0, 31).reshape(31, 1)
+    sqrt_abs_ok0 = np.sqrt(np.abs(ok0))
+    params = (ok0, sqrt_abs_ok0, 1 / sqrt_abs_ok0, 2 * np.pi * dh**3 / ok0, arcfn)
+
+    expect = (
+        4.0
+        * np.pi
+        * dh**3
+        / (2.0 * ok0)
+        * (x * np.sqrt(1 + ok0 * x**2) - arcfn(sqrt_abs_ok0 * x) / sqrt_abs_ok0)
+    )
+    cv = _comoving_volume_curved(x.copy(), params)
+    assert cv.shape == x.shape
+    assert np.allclose(cv, expect, rtol=1e-12, atol=0)
+
+    # small x: V_c -> 4/3 pi d_M^3, independent of curvature
+    assert np.allclose(cv[1:4], 4.0 / 3.0 * np.pi * (dh * x[1:4]) ** 3, rtol=1e-2)
+
+
 class Test_StandardCosmologyWrapper(
     TotalComponent_Test,
     CurvatureComponent_Test,
@@ -71,3 +97,64 @@ class Test_StandardCosmologyWrapper(
         # TODO: it should be an instance
         with pytest.raises(NotImplementedError):
             assert isinstance(wrapper, StandardCosmologyWrapperAPI)
+
+    @given(z_arr_st(max_value=1e5))
+    def test_dtype(self, wrapper, z):
+        """Test that ``dtype`` sets the output dtype of the CLASS functions."""
+        for method in (
+            wrapper.Omega_m,
+            wrapper.H,
+            wrapper.angular_diameter_distance,
+            wrapper.luminosity_distance,
+        ):
+            out = method(z, dtype=np.float32)
+            assert out.dtype == np.float32
+            assert np.allclose(out, method(z), rtol=1e-6)
+
+    @given(z_arr_st(max_value=1e5))
+    def test_evaluate_background(self, wrapper, z):
+        """Test that ``evaluate_background`` agrees with the individual methods."""
+        out = wrapper.evaluate_background(z)
+        assert set(out) == {
+            "Omega_m",
+            "H",
+            "angular_diameter_distance",
+            "luminosity_distance",
+        }
+        for name, value in out.items():
+            assert np.allclose(value, getattr(wrapper, name)(z))
+            assert isinstance(value, np.ndarray)
+
+        out = wrapper.evaluate_background(z, which=("H",))
+        assert set(out) == {"H"}
+        assert np.allclose(out["H"], wrapper.H(z))
+
+    def test_evaluate_background_unknown(self, wrapper):
+        """Test that ``evaluate_background`` rejects unknown methods."""
+        with pytest.raises(ValueError, match="cannot evaluate"):
+            wrapper.evaluate_background(1.0, which=("H", "age"))
+        with pytest.raises(TypeError, match="iterable of method names"):
+            wrapper.evaluate_background(1.0, which="H")
+
+    def test_memoized_results_are_copies(self, wrapper):
+        """Test that modifying a result does not affect later calls."""
+        z = np.linspace(0, 10, 50)
+        H = wrapper.H(z)
+        H[:] = 0
+        assert np.array_equal(wrapper.H(z), wrapper.H(z.copy()))
+        assert np.all(wrapper.H(z) > 0)
+
+    def test_scalars_are_cached(self, wrapper):
+        """Test that scalar properties are shared read-only arrays."""
+        assert wrapper.H0 is wrapper.H0
+        assert not wrapper.H0.flags.writeable
+
+    @given(z_arr_st(max_value=1e5))
+    def test_distances(self, wrapper, z):
+        """Test that ``distances`` agrees with the individual distance methods."""
+        da, dl = wrapper.distances(z)
+        assert np.allclose(da, wrapper.angular_diameter_distance(z))
+        # the derived d_L inherits the d_A interpolation error, <~5e-5 at low z
+        assert np.allclose(dl, wrapper.luminosity_distance(z), rtol=1e-4)
+        assert isinstance(da, np.ndarray)
+        assert isinstance(dl, np.ndarray)